@@ -4,8 +4,8 @@
 import sys
 from pathlib import Path
 
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Always run the working tree, even if a release of ollama_tui is installed
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
 
 from ollama_tui.app import main
 
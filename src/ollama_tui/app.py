@@ -2,6 +2,8 @@
 
 import argparse
 import logging
+import logging.handlers
+import os
 from pathlib import Path
 
 from textual.app import App, ComposeResult
@@ -12,13 +14,6 @@ from . import __version__
 from .ollama_client import OllamaClient, flush_cache
 from .widgets import ModelsView, PSView, SearchView
 
-# Setup file logging
-LOG_FILE = Path(__file__).parent.parent.parent.parent / "ollama_tui.log"
-logging.basicConfig(
-    filename=str(LOG_FILE),
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -28,16 +23,20 @@ class OllamaTUI(App):
     CSS_PATH = Path(__file__).parent / "styles" / "app.tcss"
     TITLE = f"Ollama TUI v{__version__}"
 
-    BINDINGS = [
+    BINDINGS = (
         Binding("1", "tab_models", "Models", show=True),
         Binding("2", "tab_ps", "Running", show=True),
         Binding("3", "tab_search", "Search", show=True),
         Binding("left", "tab_prev", "Prev Tab", show=False),
         Binding("right", "tab_next", "Next Tab", show=False),
         Binding("q", "quit", "Quit", show=True),
-    ]
+    )
+
+    TAB_ORDER = ("models", "ps", "search")
+    TAB_INDEX = {tab_id: idx for idx, tab_id in enumerate(TAB_ORDER)}
 
-    TAB_ORDER = ["models", "ps", "search"]
+    # Scripted runs (e.g. screenshot generation) can skip the startup probe
+    skip_availability_check = False
 
     def compose(self) -> ComposeResult:
         logger.info("Composing app UI")
@@ -53,11 +52,20 @@ class OllamaTUI(App):
         logger.info("App UI composed")
 
     async def on_mount(self) -> None:
-        """Check Ollama availability on startup."""
+        """Cache tab widgets and check Ollama availability on startup."""
+        self._tc = self.query_one(TabbedContent)
+        self._tables = {
+            tab_id: self.query_one(f"#{tab_id}-table", DataTable)
+            for tab_id in self.TAB_ORDER
+        }
+
+        if self.skip_availability_check:
+            return
+
         logger.info("App mounted, checking ollama availability")
         client = OllamaClient()
         available = await client.check_available()
-        logger.info(f"Ollama available: {available}")
+        logger.info("Ollama available: %s", available)
         if not available:
             self.notify(
                 "Ollama not found! Please install ollama.",
@@ -67,42 +75,32 @@ class OllamaTUI(App):
 
     def action_tab_models(self) -> None:
         """Switch to Models tab."""
-        self.query_one(TabbedContent).active = "models"
-        self.call_after_refresh(lambda: self.query_one("#models-table", DataTable).focus())
+        self._switch_to_tab("models")
 
     def action_tab_ps(self) -> None:
         """Switch to Running tab."""
-        self.query_one(TabbedContent).active = "ps"
-        self.call_after_refresh(lambda: self.query_one("#ps-table", DataTable).focus())
+        self._switch_to_tab("ps")
 
     def action_tab_search(self) -> None:
         """Switch to Search tab."""
-        self.query_one(TabbedContent).active = "search"
-        self.call_after_refresh(lambda: self.query_one("#search-table", DataTable).focus())
+        self._switch_to_tab("search")
 
     def action_tab_prev(self) -> None:
         """Switch to previous tab."""
-        tc = self.query_one(TabbedContent)
-        current_idx = self.TAB_ORDER.index(tc.active)
+        current_idx = self.TAB_INDEX[self._tc.active]
         new_idx = (current_idx - 1) % len(self.TAB_ORDER)
         self._switch_to_tab(self.TAB_ORDER[new_idx])
 
     def action_tab_next(self) -> None:
         """Switch to next tab."""
-        tc = self.query_one(TabbedContent)
-        current_idx = self.TAB_ORDER.index(tc.active)
+        current_idx = self.TAB_INDEX[self._tc.active]
         new_idx = (current_idx + 1) % len(self.TAB_ORDER)
         self._switch_to_tab(self.TAB_ORDER[new_idx])
 
     def _switch_to_tab(self, tab_id: str) -> None:
         """Switch to tab and focus its main widget."""
-        self.query_one(TabbedContent).active = tab_id
-        table_ids = {
-            "models": "#models-table",
-            "ps": "#ps-table",
-            "search": "#search-table",
-        }
-        self.call_after_refresh(lambda: self.query_one(table_ids[tab_id], DataTable).focus())
+        self._tc.active = tab_id
+        self.call_after_refresh(self._tables[tab_id].focus)
 
     def on_search_view_pull_completed(self, event: SearchView.PullCompleted) -> None:
         """Handle pull completed - switch to Models tab and refresh."""
@@ -110,6 +108,26 @@ class OllamaTUI(App):
         self.query_one(ModelsView).refresh_models()
 
 
+def setup_logging() -> None:
+    """Setup file logging (DEBUG opt-in via OLLAMA_TUI_DEBUG=1).
+
+    Records are buffered and written in batches; errors and logging.shutdown()
+    at exit flush the buffer.
+    """
+    log_file = Path(__file__).resolve().parents[3] / "ollama_tui.log"
+    file_handler = logging.FileHandler(str(log_file), delay=True)
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    root_logger = logging.getLogger()
+    root_logger.addHandler(
+        logging.handlers.MemoryHandler(
+            capacity=1000, flushLevel=logging.ERROR, target=file_handler
+        )
+    )
+    root_logger.setLevel(logging.DEBUG if os.getenv("OLLAMA_TUI_DEBUG") else logging.WARNING)
+
+
 def main():
     """Run the Ollama TUI application."""
     parser = argparse.ArgumentParser(
@@ -127,6 +145,8 @@ def main():
     )
     args = parser.parse_args()
 
+    setup_logging()
+
     if args.flush_cache:
         flush_cache()
         print("Cache cleared.")
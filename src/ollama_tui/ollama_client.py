@@ -1,29 +1,78 @@
 """Async wrapper for Ollama CLI commands."""
 
 import asyncio
-import codecs
 import html
 import json
 import logging
+import os
 import re
 import shutil
+import subprocess
 import time
 import urllib.request
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import MISSING, dataclass, fields
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup for the cache files
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-# ANSI escape sequence pattern for stripping terminal control codes
-ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]|\x1b\].*?\x07|\x1b[PX^_].*?\x1b\\')
+# ANSI escape sequence patterns for stripping terminal control codes. CSI
+# (including private modes like ESC[?25l) is what progress bars emit; OSC
+# ending in BEL and DCS/SOS/PM/APC ending in ESC \ are rare, so they get their
+# own pattern that only runs when an ESC survives the first. Negated classes
+# instead of lazy .*? keep matching linear on unterminated sequences.
+ANSI_CSI_PATTERN = re.compile(r'\x1b\[[0-9;?]*[a-zA-Z]')
+ANSI_STRING_PATTERN = re.compile(
+    r'\x1b\][^\x07]*\x07'
+    r'|\x1b[PX^_][^\x1b]*(?:\x1b(?!\\)[^\x1b]*)*\x1b\\'
+)
+
+# Line separators in `ollama pull` output (progress redraws use a bare \r)
+LINE_SEPARATOR_PATTERN = re.compile(rb'[\r\n]')
+
+# Units that can follow a size in `ollama list` / `ollama ps` output
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+FORMAT_UNITS = (*SIZE_UNITS, "PB")
+
+# Full-row patterns for `ollama list` / `ollama ps`, only used for the rare
+# rows that the str.split fast path cannot take apart
+LIST_LINE_PATTERN = re.compile(r"^(\S+)\s+(\w+)\s+(\d+\.?\d*\s*[KMGT]?B)\s+(.+?)\s*$")
+PS_LINE_PATTERN = re.compile(
+    r"^(\S+)\s+(\w+)\s+(\d+\.?\d*\s*[KMGT]?B)\s+(\S+\s+\S+)\s+(\d+)\s+(.+?)\s*$"
+)
+
+# Registry HTML patterns, matched against the raw page bytes. Model cards start
+# at a library link and tag rows at a hidden command input; the fields of each
+# block are found in a single pass between one start and the next, the named
+# group that matched telling which field it is.
+LIBRARY_LINK_PATTERN = re.compile(rb'<a href="/library/([^"]*)')
+MODEL_FIELDS_PATTERN = re.compile(
+    rb'x-test-size[^>]*>(?P<size>[^<]+)</span>'
+    rb'|text-neutral-800 text-md">(?P<desc>[^<]+)</p>'
+    rb'|x-test-updated[^>]*>(?P<updated>[^<]+)</span>'
+)
+TAG_INPUT_PATTERN = re.compile(rb'<input class="command hidden" value="([^"]*)"')
+TAG_FIELDS_PATTERN = re.compile(
+    rb'col-span-2 text-neutral-500 text-\[13px\]">(?P<size>[^<]+)</p>'
+    rb'|x-test-updated[^>]*>(?P<updated>[^<]+)</span>'
+)
 
 # Cache configuration
 CACHE_DIR = Path.home() / ".cache" / "ollama-tui"
 CACHE_TTL = 24 * 60 * 60  # 24 hours in seconds
 
+# Seconds before a one-shot ollama command (list, ps, rm, ...) is killed
+ONESHOT_TIMEOUT = 30
+
+# Decoded cache entries for this process: cache file -> (timestamp, items)
+_MEM_CACHE: dict[Path, tuple[float, list]] = {}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RemoteModel:
     """Represents a model available on Ollama registry."""
 
@@ -33,7 +82,7 @@ class RemoteModel:
     updated: str = ""  # e.g. "2 months ago"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelTag:
     """Represents a specific tag/version of a model."""
 
@@ -42,7 +91,7 @@ class ModelTag:
     updated: str = ""  # e.g. "3 weeks ago"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Model:
     """Represents a local Ollama model."""
 
@@ -52,7 +101,7 @@ class Model:
     modified: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunningModel:
     """Represents a running Ollama model."""
 
@@ -66,9 +115,46 @@ class RunningModel:
 
 def flush_cache() -> None:
     """Delete all cached data."""
+    _MEM_CACHE.clear()
     if CACHE_DIR.exists():
         shutil.rmtree(CACHE_DIR)
-        logger.info(f"Cache flushed: {CACHE_DIR}")
+        logger.info("Cache flushed: %s", CACHE_DIR)
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, with orjson if it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode an object as JSON bytes, with orjson if it is installed."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def _to_columns(cls, items: list) -> dict[str, list]:
+    """Lay out dataclass instances column-wise: one list per field."""
+    return {f.name: [getattr(item, f.name) for item in items] for f in fields(cls)}
+
+
+def _from_columns(cls, columns: dict[str, list]) -> list | None:
+    """Rebuild dataclass instances from per-field lists.
+
+    Columns missing from an older cache file are filled from the field
+    default; returns None (a cache miss) if the columns cannot be used.
+    """
+    try:
+        count = max(map(len, columns.values()), default=0)
+        return [
+            cls(*row)
+            for row in zip(*(
+                [f.default] * count
+                if f.name not in columns and f.default is not MISSING
+                else columns[f.name]
+                for f in fields(cls)
+            ))
+        ]
+    except (KeyError, TypeError):
+        return None
 
 
 def _get_cache(cache_file: Path) -> dict | None:
@@ -76,22 +162,136 @@ def _get_cache(cache_file: Path) -> dict | None:
     if not cache_file.exists():
         return None
     try:
-        data = json.loads(cache_file.read_text())
+        data = _json_loads(cache_file.read_bytes())
         if time.time() - data.get("timestamp", 0) < CACHE_TTL:
-            logger.info(f"Cache hit: {cache_file.name}")
+            logger.info("Cache hit: %s", cache_file.name)
             return data
-        logger.info(f"Cache expired: {cache_file.name}")
+        logger.info("Cache expired: %s", cache_file.name)
     except (json.JSONDecodeError, KeyError):
-        logger.warning(f"Invalid cache file: {cache_file}")
+        logger.warning("Invalid cache file: %s", cache_file)
     return None
 
 
+def _get_mem_cache(cache_file: Path) -> list | None:
+    """Get items already decoded in this process if valid (within TTL)."""
+    entry = _MEM_CACHE.get(cache_file)
+    if entry and time.time() - entry[0] < CACHE_TTL:
+        return list(entry[1])
+    return None
+
+
+def _set_mem_cache(cache_file: Path, timestamp: float, items: list) -> None:
+    """Remember decoded items for the rest of the process."""
+    _MEM_CACHE[cache_file] = (timestamp, list(items))
+
+
 def _set_cache(cache_file: Path, data: dict) -> None:
     """Save data to cache with timestamp."""
     cache_file.parent.mkdir(parents=True, exist_ok=True)
     data["timestamp"] = time.time()
-    cache_file.write_text(json.dumps(data))
-    logger.info(f"Cache saved: {cache_file.name}")
+    # Write next to the cache file and rename over it, so an interrupted
+    # write never leaves a truncated file behind
+    tmp_file = cache_file.with_suffix(cache_file.suffix + ".tmp")
+    tmp_file.write_bytes(_json_dumps(data))
+    os.replace(tmp_file, cache_file)
+    logger.info("Cache saved: %s", cache_file.name)
+
+
+async def _iter_lines_cr_lf(reader: asyncio.StreamReader):
+    """Yield raw lines from reader, split on either \\r or \\n.
+
+    Progress bars redraw with a bare \\r, so a line is yielded as soon as
+    either separator arrives. \\r and \\n never occur inside a multi-byte
+    UTF-8 sequence, so every yielded line can be decoded on its own.
+    """
+    tail = b""
+    # read() returns whatever is buffered, so a large size never waits for
+    # more output; it only lets a burst of redraws arrive in one chunk
+    while chunk := await reader.read(4096):
+        *lines, tail = LINE_SEPARATOR_PATTERN.split(tail + chunk)
+        for line in lines:
+            yield line
+    if tail:
+        yield tail
+
+
+def _strip_ansi(text: str) -> str:
+    """Remove ANSI escape sequences from text.
+
+    Most lines have none and are returned as is; otherwise the pieces
+    between CSI sequences are joined back together.
+    """
+    if '\x1b' not in text:
+        return text
+    text = "".join(ANSI_CSI_PATTERN.split(text))
+    if '\x1b' in text:
+        text = ANSI_STRING_PATTERN.sub('', text)
+    return text
+
+
+async def _run_oneshot(*args: str) -> subprocess.CompletedProcess:
+    """Run a short ollama command to completion in a worker thread.
+
+    Commands that don't stream output skip the asyncio subprocess transport,
+    which costs more per spawn than the command itself (notably on Windows).
+    Cancelling the caller does not stop the thread, so a hung command is
+    killed after ONESHOT_TIMEOUT and reported as a failed run.
+    """
+    cmd = ["ollama", *args]
+    try:
+        return await asyncio.to_thread(
+            subprocess.run,
+            cmd,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=ONESHOT_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        logger.error("Command timed out: %s", " ".join(cmd))
+        return subprocess.CompletedProcess(
+            cmd, -1, b"", f"ollama {args[0]} timed out after {ONESHOT_TIMEOUT}s".encode()
+        )
+
+
+def _fetch_page(url: str) -> bytes:
+    """Download a registry page (blocking; run it in a worker thread)."""
+    req = urllib.request.Request(url, headers={"User-Agent": "ollama-tui/0.1"})
+    with urllib.request.urlopen(req, timeout=15) as resp:
+        return resp.read()
+
+
+def _iter_blocks(pattern: re.Pattern, page: bytes):
+    """Yield each match of pattern with the offset where its block ends.
+
+    A block runs from one match to the start of the next (or the end of the
+    page), so callers can search fields with pos/endpos instead of slicing.
+    """
+    matches = list(pattern.finditer(page))
+    ends = [m.start() for m in matches[1:]] + [len(page)]
+    return zip(matches, ends)
+
+
+def _split_size(text: str) -> tuple[str, str] | None:
+    """Split a leading size like "4.7 GB" or "4.7GB" off the rest of a row.
+
+    Returns (size, rest) with rest right-stripped, or None if text does not
+    start with a size.
+    """
+    parts = text.split(None, 2)
+    if len(parts) >= 2 and parts[1] in SIZE_UNITS:
+        number, size = parts[0], f"{parts[0]} {parts[1]}"
+        rest = parts[2] if len(parts) == 3 else ""
+    elif parts:
+        size = parts[0]
+        number = size.rstrip("KMGTB")
+        if size[len(number):] not in SIZE_UNITS:
+            return None
+        rest = text.split(None, 1)[1] if len(parts) > 1 else ""
+    else:
+        return None
+    if not number.replace(".", "", 1).isdigit():
+        return None
+    return size, rest.rstrip()
 
 
 class OllamaClient:
@@ -100,38 +300,24 @@ class OllamaClient:
     async def check_available(self) -> bool:
         """Check if ollama CLI is available."""
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "ollama",
-                "--version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            await proc.wait()
+            proc = await _run_oneshot("--version")
             return proc.returncode == 0
         except FileNotFoundError:
             return False
 
     async def list_models(self) -> list[Model]:
         """Get list of local models from 'ollama list'."""
-        proc = await asyncio.create_subprocess_exec(
-            "ollama",
-            "list",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await proc.communicate()
-        return self._parse_list_output(stdout.decode())
+        proc = await _run_oneshot("list")
+        if not proc.stdout:
+            return []
+        return self._parse_list_output(proc.stdout.decode())
 
     async def list_running(self) -> list[RunningModel]:
         """Get list of running models from 'ollama ps'."""
-        proc = await asyncio.create_subprocess_exec(
-            "ollama",
-            "ps",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await proc.communicate()
-        return self._parse_ps_output(stdout.decode())
+        proc = await _run_oneshot("ps")
+        if not proc.stdout:
+            return []
+        return self._parse_ps_output(proc.stdout.decode())
 
     async def pull_model(self, model_name: str):
         """Pull a model, yielding progress lines."""
@@ -143,263 +329,222 @@ class OllamaClient:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,
         )
-        buffer = ""
-        # Use incremental decoder to handle multi-byte UTF-8 chars split across chunks
-        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
-        while True:
-            chunk = await proc.stdout.read(256)
-            if not chunk:
-                # Flush any remaining bytes from decoder
-                buffer += decoder.decode(b'', final=True)
-                break
-            buffer += decoder.decode(chunk)
-            # Split by carriage return or newline
-            while "\r" in buffer or "\n" in buffer:
-                # Find the earliest separator
-                r_pos = buffer.find("\r")
-                n_pos = buffer.find("\n")
-                if r_pos == -1:
-                    pos = n_pos
-                elif n_pos == -1:
-                    pos = r_pos
-                else:
-                    pos = min(r_pos, n_pos)
-                line = buffer[:pos].strip()
-                buffer = buffer[pos + 1:]
-                if line:
-                    # Strip ANSI escape sequences from output
-                    clean_line = ANSI_ESCAPE_PATTERN.sub('', line)
-                    if clean_line:
-                        yield clean_line
-        # Yield any remaining content
-        if buffer.strip():
-            clean_buffer = ANSI_ESCAPE_PATTERN.sub('', buffer.strip())
-            if clean_buffer:
-                yield clean_buffer
+        async for raw_line in _iter_lines_cr_lf(proc.stdout):
+            # \r\n pairs and redraws leave many blank lines: drop them before
+            # decoding (UTF-8 decoding of ASCII output is already a fast path)
+            raw_line = raw_line.strip()
+            if raw_line:
+                clean_line = _strip_ansi(raw_line.decode("utf-8", errors="replace"))
+                if clean_line:
+                    yield clean_line
         await proc.wait()
 
     async def delete_model(self, model_name: str) -> tuple[bool, str]:
         """Delete a model with 'ollama rm'."""
-        proc = await asyncio.create_subprocess_exec(
-            "ollama",
-            "rm",
-            model_name,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
+        proc = await _run_oneshot("rm", model_name)
         success = proc.returncode == 0
-        message = stdout.decode() if success else stderr.decode()
-        return success, message.strip()
+        return success, (proc.stdout if success else proc.stderr).strip().decode()
 
     async def stop_model(self, model_name: str) -> tuple[bool, str]:
         """Stop a running model with 'ollama stop'."""
-        proc = await asyncio.create_subprocess_exec(
-            "ollama",
-            "stop",
-            model_name,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
+        proc = await _run_oneshot("stop", model_name)
         success = proc.returncode == 0
-        message = stdout.decode() if success else stderr.decode()
-        return success, message.strip()
+        return success, (proc.stdout if success else proc.stderr).strip().decode()
 
     async def show_model(self, model_name: str) -> str:
         """Get model details with 'ollama show'."""
-        proc = await asyncio.create_subprocess_exec(
-            "ollama",
-            "show",
-            model_name,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
+        proc = await _run_oneshot("show", model_name)
         if proc.returncode == 0:
-            return stdout.decode()
-        return f"Error: {stderr.decode()}"
+            return proc.stdout.decode()
+        return f"Error: {proc.stderr.decode()}"
+
+    def search_models_cached(self) -> list[RemoteModel] | None:
+        """Return the cached library models, or None if they must be fetched."""
+        cache_file = CACHE_DIR / "models.json"
+
+        # In-process first, then disk
+        models = _get_mem_cache(cache_file)
+        if models is not None:
+            return models
+        cached = _get_cache(cache_file)
+        if cached and isinstance(cached.get("models"), dict):
+            models = _from_columns(RemoteModel, cached["models"])
+            if models is not None:
+                _set_mem_cache(cache_file, cached["timestamp"], models)
+                return models
+        return None
 
     async def search_models(self) -> list[RemoteModel]:
         """Fetch available models from Ollama library via scraping (cached 24h)."""
         cache_file = CACHE_DIR / "models.json"
 
         # Check cache first
-        cached = _get_cache(cache_file)
-        if cached and "models" in cached:
-            return [RemoteModel(**m) for m in cached["models"]]
+        models = self.search_models_cached()
+        if models is not None:
+            return models
 
         # Fetch from network
-        loop = asyncio.get_event_loop()
         try:
-            def fetch():
-                req = urllib.request.Request(
-                    "https://ollama.com/library",
-                    headers={"User-Agent": "ollama-tui/0.1"},
-                )
-                with urllib.request.urlopen(req, timeout=15) as resp:
-                    return resp.read().decode()
+            page_content = await asyncio.to_thread(_fetch_page, "https://ollama.com/library")
 
-            page_content = await loop.run_in_executor(None, fetch)
-
-            # Split by model links and parse each block
+            # Parse each model card in place and decode only the extracted fields
             models = []
-            model_blocks = re.split(r'<a href="/library/', page_content)[1:]
-
-            for block in model_blocks:
-                # Extract name
-                name_match = re.match(r'([^"]+)', block)
-                if not name_match:
-                    continue
-                name = name_match.group(1)
+            for match, end in _iter_blocks(LIBRARY_LINK_PATTERN, page_content):
+                name = match.group(1).decode()
                 if not name or name.startswith("?"):
                     continue
-
-                # Extract sizes (parameter counts like 7b, 70b)
-                sizes = re.findall(r'x-test-size[^>]*>([^<]+)</span>', block)
+                start = match.end()
+
+                # Sizes (parameter counts like 7b, 70b) are all collected; the
+                # description and updated date are the first of their kind
+                sizes = []
+                found = {}
+                for m in MODEL_FIELDS_PATTERN.finditer(page_content, start, end):
+                    if m.lastgroup == "size":
+                        sizes.append(m.group("size").decode())
+                    else:
+                        found.setdefault(m.lastgroup, m)
                 sizes_str = ", ".join(sizes) if sizes else "-"
 
-                # Extract description (decode HTML entities)
-                desc_match = re.search(r'text-neutral-800 text-md">([^<]+)</p>', block)
-                description = html.unescape(desc_match.group(1).strip()) if desc_match else ""
-
-                # Extract updated date
-                updated_match = re.search(r'x-test-updated[^>]*>([^<]+)</span>', block)
-                updated = updated_match.group(1).strip() if updated_match else ""
+                # Decode HTML entities in the description
+                desc_match = found.get("desc")
+                description = html.unescape(desc_match.group("desc").decode().strip()) if desc_match else ""
+                updated_match = found.get("updated")
+                updated = updated_match.group("updated").decode().strip() if updated_match else ""
 
                 models.append(RemoteModel(name=name, sizes=sizes_str, description=description, updated=updated))
 
-            logger.info(f"Fetched {len(models)} remote models from library")
+            logger.info("Fetched %s remote models from library", len(models))
 
             # Save to cache
-            _set_cache(cache_file, {"models": [asdict(m) for m in models]})
+            data = {"models": _to_columns(RemoteModel, models)}
+            _set_cache(cache_file, data)
+            _set_mem_cache(cache_file, data["timestamp"], models)
 
             return models
         except Exception as e:
-            logger.error(f"Failed to fetch remote models: {e}")
+            logger.error("Failed to fetch remote models: %s", e)
             return []
 
     async def fetch_model_tags(self, model_name: str) -> list[ModelTag]:
         """Fetch available tags/versions for a model with their sizes (cached 24h)."""
         cache_file = CACHE_DIR / "tags" / f"{model_name}.json"
 
-        # Check cache first
+        # Check cache first (in-process, then disk)
+        tags = _get_mem_cache(cache_file)
+        if tags is not None:
+            return tags
         cached = _get_cache(cache_file)
-        if cached and "tags" in cached:
-            return [ModelTag(**t) for t in cached["tags"]]
+        if cached and isinstance(cached.get("tags"), dict):
+            tags = _from_columns(ModelTag, cached["tags"])
+            if tags is not None:
+                _set_mem_cache(cache_file, cached["timestamp"], tags)
+                return tags
 
         # Fetch from network
-        loop = asyncio.get_event_loop()
         try:
-            def fetch():
-                req = urllib.request.Request(
-                    f"https://ollama.com/library/{model_name}/tags",
-                    headers={"User-Agent": "ollama-tui/0.1"},
-                )
-                with urllib.request.urlopen(req, timeout=15) as resp:
-                    return resp.read().decode()
-
-            page_content = await loop.run_in_executor(None, fetch)
+            page_content = await asyncio.to_thread(_fetch_page, f"https://ollama.com/library/{model_name}/tags")
 
             tags = []
             # Find all tag entries: input with value and following size
             # Pattern: <input class="command hidden" value="model:tag" /> ... <p class="col-span-2 text-neutral-500 text-[13px]">SIZE</p>
-            blocks = re.split(r'<input class="command hidden" value="', page_content)[1:]
-
-            for block in blocks:
-                # Extract tag name
-                tag_match = re.match(r'([^"]+)"', block)
-                if not tag_match:
+            for match, end in _iter_blocks(TAG_INPUT_PATTERN, page_content):
+                tag = match.group(1).decode()
+                if not tag:
                     continue
-                tag = tag_match.group(1)
-
-                # Extract size
-                size_match = re.search(r'col-span-2 text-neutral-500 text-\[13px\]">([^<]+)</p>', block)
-                size = size_match.group(1).strip() if size_match else "-"
-
-                # Extract updated date
-                updated_match = re.search(r'x-test-updated[^>]*>([^<]+)</span>', block)
-                updated = updated_match.group(1).strip() if updated_match else ""
+                start = match.end()
+
+                # Extract size and updated date, keeping the first of each
+                found = {}
+                for m in TAG_FIELDS_PATTERN.finditer(page_content, start, end):
+                    found.setdefault(m.lastgroup, m)
+                    if len(found) == 2:
+                        break
+                size_match = found.get("size")
+                size = size_match.group("size").decode().strip() if size_match else "-"
+                updated_match = found.get("updated")
+                updated = updated_match.group("updated").decode().strip() if updated_match else ""
 
                 tags.append(ModelTag(tag=tag, size=size, updated=updated))
 
-            logger.info(f"Fetched {len(tags)} tags for {model_name}")
+            logger.info("Fetched %s tags for %s", len(tags), model_name)
 
             # Save to cache
-            _set_cache(cache_file, {"tags": [asdict(t) for t in tags]})
+            data = {"tags": _to_columns(ModelTag, tags)}
+            _set_cache(cache_file, data)
+            _set_mem_cache(cache_file, data["timestamp"], tags)
 
             return tags
         except Exception as e:
-            logger.error(f"Failed to fetch tags for {model_name}: {e}")
+            logger.error("Failed to fetch tags for %s: %s", model_name, e)
             return []
 
     def _format_size(self, size_bytes: int) -> str:
         """Format bytes to human readable size."""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} PB"
+        # Each unit is 2**10 times the previous one, so the bit length picks it
+        idx = min((max(size_bytes, 1).bit_length() - 1) // 10, len(FORMAT_UNITS) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {FORMAT_UNITS[idx]}"
 
     def _parse_list_output(self, output: str) -> list[Model]:
         """Parse columnar output from ollama list."""
-        lines = output.strip().split("\n")
+        lines = output.strip().splitlines()
         if len(lines) < 2:
-            logger.debug(f"No models found, lines: {lines}")
+            logger.debug("No models found, lines: %s", lines)
             return []
 
         models = []
-        # Pattern: NAME (no spaces) | ID (hex) | SIZE (num + unit) | MODIFIED (rest)
+        # Columns: NAME (no spaces) | ID (hex) | SIZE (num + unit) | MODIFIED (rest)
         # Example: qwen2.5:7b    845dbda0ea48    4.7 GB    5 hours ago
-        pattern = re.compile(r"^(\S+)\s+(\w+)\s+(\d+\.?\d*\s*[KMGT]?B)\s+(.+?)\s*$")
-
         for line in lines[1:]:
-            match = pattern.match(line)
-            if match:
+            parts = line.split(None, 2)
+            sized = _split_size(parts[2]) if len(parts) == 3 else None
+            if sized and sized[1]:
                 models.append(
                     Model(
-                        name=match.group(1),
-                        id=match.group(2),
-                        size=match.group(3),
-                        modified=match.group(4).strip(),
+                        name=parts[0],
+                        id=parts[1],
+                        size=sized[0],
+                        modified=sized[1],
                     )
                 )
+            elif match := LIST_LINE_PATTERN.match(line):
+                models.append(Model(*match.groups()))
             else:
-                logger.debug(f"Failed to parse line: {line!r}")
+                logger.debug("Failed to parse line: %r", line)
 
-        logger.info(f"Parsed {len(models)} models")
+        logger.info("Parsed %s models", len(models))
         return models
 
     def _parse_ps_output(self, output: str) -> list[RunningModel]:
         """Parse columnar output from ollama ps."""
-        lines = output.strip().split("\n")
+        lines = output.strip().splitlines()
         if len(lines) < 2:
             logger.debug("No running models")
             return []
 
         models = []
-        # Pattern: NAME | ID | SIZE | PROCESSOR | CONTEXT | UNTIL
+        # Columns: NAME | ID | SIZE | PROCESSOR | CONTEXT | UNTIL
         # Example: ministral-3:3b    f04aa1c738f6    5.0 GB    40%/60% CPU/GPU    4096    4 minutes from now
         # PROCESSOR can be "100% GPU" or "40%/60% CPU/GPU" (always two space-separated tokens)
-        pattern = re.compile(
-            r"^(\S+)\s+(\w+)\s+(\d+\.?\d*\s*[KMGT]?B)\s+(\S+\s+\S+)\s+(\d+)\s+(.+?)\s*$"
-        )
-
         for line in lines[1:]:
-            match = pattern.match(line)
-            if match:
+            parts = line.split(None, 2)
+            sized = _split_size(parts[2]) if len(parts) == 3 else None
+            rest = sized[1].split(None, 3) if sized else []
+            if len(rest) == 4 and rest[2].isdigit():
                 models.append(
                     RunningModel(
-                        name=match.group(1),
-                        id=match.group(2),
-                        size=match.group(3),
-                        processor=match.group(4),
-                        context=match.group(5),
-                        until=match.group(6).strip(),
+                        name=parts[0],
+                        id=parts[1],
+                        size=sized[0],
+                        processor=f"{rest[0]} {rest[1]}",
+                        context=rest[2],
+                        until=rest[3],
                     )
                 )
+            elif match := PS_LINE_PATTERN.match(line):
+                models.append(RunningModel(*match.groups()))
             else:
-                logger.debug(f"Failed to parse ps line: {line!r}")
+                logger.debug("Failed to parse ps line: %r", line)
 
-        logger.info(f"Parsed {len(models)} running models")
+        logger.info("Parsed %s running models", len(models))
         return models
@@ -1,5 +1,7 @@
 """Pull progress modal screen."""
 
+import re
+
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.screen import ModalScreen
@@ -9,6 +11,12 @@ from textual.message import Message
 
 from ..ollama_client import OllamaClient
 
+# Percentage in a progress line like "pulling abc123... 45%"
+PERCENT_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+
+# Seconds between two redraws of the progress (about 30 per second)
+RENDER_INTERVAL = 0.033
+
 
 class PullProgressScreen(ModalScreen[bool]):
     """Modal screen showing pull progress."""
@@ -48,6 +56,8 @@ class PullProgressScreen(ModalScreen[bool]):
         super().__init__()
         self.model_name = model_name
         self._cancelled = False
+        # Newest progress line not drawn yet
+        self._pending_line: str | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -69,6 +79,19 @@ class PullProgressScreen(ModalScreen[bool]):
             self._cancelled = True
             self.dismiss(False)
 
+    def _render_progress(self) -> None:
+        """Draw the newest progress line, if there is a new one."""
+        line = self._pending_line
+        if line is None:
+            return
+        self._pending_line = None
+        self.query_one("#pull-status", Static).update(line)
+
+        # Try to parse percentage from line
+        match = PERCENT_PATTERN.search(line)
+        if match:
+            self.query_one("#pull-progress", ProgressBar).update(progress=float(match.group(1)))
+
     @work(exclusive=True)
     async def _do_pull(self) -> None:
         status = self.query_one("#pull-status", Static)
@@ -77,26 +100,19 @@ class PullProgressScreen(ModalScreen[bool]):
         client = OllamaClient()
         last_line = ""
 
-        async for line in client.pull_model(self.model_name):
-            if self._cancelled:
-                return
-
-            if line:
-                last_line = line
-                status.update(line)
-
-                # Try to parse percentage from line
-                if "%" in line:
-                    try:
-                        # Extract percentage like "pulling abc123... 45%"
-                        parts = line.split("%")[0].split()
-                        for part in reversed(parts):
-                            if part.replace(".", "").isdigit():
-                                pct = float(part)
-                                progress.update(progress=pct)
-                                break
-                    except (ValueError, IndexError):
-                        pass
+        # Progress redraws can arrive far faster than they can be seen, so
+        # only the newest line is kept and a timer draws it
+        render_timer = self.set_interval(RENDER_INTERVAL, self._render_progress)
+        try:
+            async for line in client.pull_model(self.model_name):
+                if self._cancelled:
+                    return
+
+                if line:
+                    last_line = line
+                    self._pending_line = line
+        finally:
+            render_timer.stop()
 
         if self._cancelled:
             return
@@ -65,12 +65,15 @@ class TagSelectionScreen(ModalScreen[str | None]):
         table.add_columns("Tag", "Size", "Updated")
         table.cursor_type = "row"
 
-        for tag in self.tags:
-            # Show just the tag suffix (e.g., "8b" instead of "llama3.1:8b")
-            tag_display = tag.tag.split(":")[-1] if ":" in tag.tag else tag.tag
-            if tag.tag in self.local_models:
-                tag_display = f"* {tag_display}"
-            table.add_row(tag_display, tag.size, tag.updated, key=tag.tag)
+        # Rows are added one by one because each needs its full tag as key;
+        # batching still lays the table out once
+        with self.app.batch_update():
+            for tag in self.tags:
+                # Show just the tag suffix (e.g., "8b" instead of "llama3.1:8b")
+                tag_display = tag.tag.split(":")[-1] if ":" in tag.tag else tag.tag
+                if tag.tag in self.local_models:
+                    tag_display = f"* {tag_display}"
+                table.add_row(tag_display, tag.size, tag.updated, key=tag.tag)
 
         if table.row_count > 0:
             table.move_cursor(row=0)
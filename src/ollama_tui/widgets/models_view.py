@@ -26,6 +26,7 @@ class ModelsView(Vertical):
     def __init__(self) -> None:
         super().__init__()
         self._first_load = True
+        self._client = OllamaClient()
 
     def compose(self) -> ComposeResult:
         yield DataTable(id="models-table")
@@ -44,17 +45,17 @@ class ModelsView(Vertical):
         table = self.query_one("#models-table", DataTable)
         table.loading = True
 
-        client = OllamaClient()
-        models = await client.list_models()
+        models = await self._client.list_models()
 
-        table.clear()
-        for model in models:
-            table.add_row(model.name, model.id, model.size, model.modified)
+        # Rebuild the table in one batch so it is laid out once, not per row
+        with self.app.batch_update():
+            table.clear()
+            table.add_rows((m.name, m.id, m.size, m.modified) for m in models)
 
-        table.loading = False
-        # Move cursor to first row after loading
-        if table.row_count > 0:
-            table.move_cursor(row=0)
+            table.loading = False
+            # Move cursor to first row after loading
+            if table.row_count > 0:
+                table.move_cursor(row=0)
         # Focus table on first load
         if self._first_load:
             self._first_load = False
@@ -86,8 +87,7 @@ class ModelsView(Vertical):
         status = self.query_one("#status-bar", Static)
         status.update(f"Deleting {model_name}...")
 
-        client = OllamaClient()
-        success, message = await client.delete_model(model_name)
+        success, message = await self._client.delete_model(model_name)
 
         if success:
             self.notify(f"Deleted {model_name}")
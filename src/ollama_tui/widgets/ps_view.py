@@ -6,7 +6,7 @@ from textual.widgets import DataTable, Static
 from textual.binding import Binding
 from textual import work
 
-from ..ollama_client import OllamaClient
+from ..ollama_client import OllamaClient, RunningModel
 from ..screens import ConfirmDialog
 
 
@@ -18,25 +18,63 @@ class PSView(Vertical):
         Binding("s", "stop_model", "Stop", show=True),
     ]
 
+    # Upper bound in seconds for the auto-refresh backoff
+    MAX_REFRESH_INTERVAL = 60
+
     def __init__(self, refresh_interval: int = 5) -> None:
         super().__init__()
         self.refresh_interval = refresh_interval
         self._refresh_timer = None
+        # Interval of the running timer: doubles while nothing changes
+        self._current_interval = refresh_interval
+        self._shown = False
+        # Reused by every refresh tick instead of one client per call
+        self._client = OllamaClient()
+        self._column_keys = []
+        # Rows currently shown, in table order: model name -> cell values
+        self._rows: dict[str, tuple[str, ...]] = {}
 
     def compose(self) -> ComposeResult:
         yield Static(
-            f"Running Models (auto-refresh: {self.refresh_interval}s)",
+            f"Running Models (auto-refresh: {self.refresh_interval}s, "
+            f"up to {self.MAX_REFRESH_INTERVAL}s when idle)",
             id="ps-title",
         )
         yield DataTable(id="ps-table")
         yield Static("", id="ps-status")
 
     def on_mount(self) -> None:
-        table = self.query_one("#ps-table", DataTable)
-        table.add_columns("Name", "ID", "Size", "Processor", "Context", "Until")
+        self._table = table = self.query_one("#ps-table", DataTable)
+        self._status = self.query_one("#ps-status", Static)
+        self._column_keys = table.add_columns(
+            "Name", "ID", "Size", "Processor", "Context", "Until"
+        )
         table.cursor_type = "row"
         self.refresh_ps()
-        self._refresh_timer = self.set_interval(self.refresh_interval, self.refresh_ps)
+        # Auto-refresh only runs while the tab is visible (see on_show/on_hide)
+        self._refresh_timer = self.set_interval(
+            self.refresh_interval, self.refresh_ps, pause=True
+        )
+
+    def on_show(self) -> None:
+        self._shown = True
+        self._set_refresh_interval(self.refresh_interval)
+        self.refresh_ps()
+        self._refresh_timer.resume()
+
+    def on_hide(self) -> None:
+        self._shown = False
+        self._refresh_timer.pause()
+
+    def _set_refresh_interval(self, interval: float) -> None:
+        """Restart the auto-refresh timer with a new interval."""
+        if interval == self._current_interval:
+            return
+        self._current_interval = interval
+        self._refresh_timer.stop()
+        self._refresh_timer = self.set_interval(
+            interval, self.refresh_ps, pause=not self._shown
+        )
 
     def on_unmount(self) -> None:
         if self._refresh_timer:
@@ -45,40 +83,64 @@ class PSView(Vertical):
     @work(exclusive=True, group="refresh")
     async def refresh_ps(self) -> None:
         """Load running models from ollama ps."""
-        table = self.query_one("#ps-table", DataTable)
-
-        client = OllamaClient()
-        models = await client.list_running()
-
-        table.clear()
-        for model in models:
-            table.add_row(
-                model.name,
-                model.id,
-                model.size,
-                model.processor,
-                model.context,
-                model.until,
-            )
+        models = await self._client.list_running()
+        previous_rows = self._rows
+        self._show_models(models)
 
-        # Move cursor to first row after loading
-        if table.row_count > 0:
-            table.move_cursor(row=0)
-
-        status = self.query_one("#ps-status", Static)
+        # Poll less often while nothing changes, back to normal on any change
+        if self._rows == previous_rows:
+            interval = min(self._current_interval * 2, self.MAX_REFRESH_INTERVAL)
+        else:
+            interval = self.refresh_interval
+        self._set_refresh_interval(interval)
+
+    def _show_models(self, models: list[RunningModel]) -> None:
+        """Show running models, touching only the rows that changed."""
+        table = self._table
+        rows = {
+            m.name: (m.name, m.id, m.size, m.processor, m.context, m.until)
+            for m in models
+        }
+        kept = [name for name in self._rows if name in rows]
+
+        # Apply all row changes in one batch so the table is laid out once
+        with self.app.batch_update():
+            if list(rows)[: len(kept)] == kept:
+                # Same order for the rows that stay: patch the table in place
+                for name in self._rows.keys() - rows.keys():
+                    table.remove_row(name)
+                for name, values in rows.items():
+                    old_values = self._rows.get(name)
+                    if old_values is None:
+                        table.add_row(*values, key=name)
+                        continue
+                    for column_key, old, new in zip(self._column_keys, old_values, values):
+                        if old != new:
+                            table.update_cell(name, column_key, new, update_width=True)
+            else:
+                table.clear()
+                for name, values in rows.items():
+                    table.add_row(*values, key=name)
+                # Move cursor to first row after loading
+                if table.row_count > 0:
+                    table.move_cursor(row=0)
+        self._rows = rows
+
+        status = self._status
         if models:
             status.update(f"{len(models)} running")
         else:
             status.update("No models running")
 
     def action_refresh(self) -> None:
+        self._set_refresh_interval(self.refresh_interval)
         self.refresh_ps()
 
     def action_stop_model(self) -> None:
-        table = self.query_one("#ps-table", DataTable)
+        table = self._table
         if table.cursor_row is not None and table.row_count > 0:
-            row = table.get_row_at(table.cursor_row)
-            model_name = str(row[0])
+            # Rows are in _rows order, keyed by model name
+            model_name = list(self._rows)[table.cursor_row]
             self.app.push_screen(
                 ConfirmDialog(f"Stop model '{model_name}'?"),
                 lambda confirmed: self._do_stop(model_name) if confirmed else None,
@@ -86,11 +148,10 @@ class PSView(Vertical):
 
     @work
     async def _do_stop(self, model_name: str) -> None:
-        status = self.query_one("#ps-status", Static)
+        status = self._status
         status.update(f"Stopping {model_name}...")
 
-        client = OllamaClient()
-        success, message = await client.stop_model(model_name)
+        success, message = await self._client.stop_model(model_name)
 
         if success:
             self.notify(f"Stopped {model_name}")
@@ -1,6 +1,7 @@
 """Search view widget - search and pull remote models."""
 
 import logging
+from bisect import bisect_right
 
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -25,13 +26,56 @@ class SearchView(Vertical):
         Binding("escape", "focus_table", "Back to list", show=False),
     ]
 
+    # Seconds of typing pause before the filter is applied
+    FILTER_DELAY = 0.06
+
     class PullCompleted(Message):
         """Message sent when a pull is completed."""
         pass
 
     def __init__(self) -> None:
         super().__init__()
-        self._all_models: list[RemoteModel] = []
+        self._all_models = []
+        self._filter_timer = None
+        self._client = OllamaClient()
+        # Model name of each table row, in row order
+        self._row_names: list[str] = []
+
+    @property
+    def _all_models(self) -> list[RemoteModel]:
+        return self._models
+
+    @_all_models.setter
+    def _all_models(self, models: list[RemoteModel]) -> None:
+        # Lowercase names once here instead of on every keystroke, and keep
+        # each table column in its own list so filtering only indexes lists
+        self._models = models
+        self._names = [m.name for m in models]
+        self._names_lower = [name.lower() for name in self._names]
+        # All lowercased names on one line each, with the offset where each
+        # starts, so a full scan is a run of str.find over a single string
+        self._haystack = "\n".join(self._names_lower)
+        self._offsets = []
+        offset = 0
+        for name in self._names_lower:
+            self._offsets.append(offset)
+            offset += len(name) + 1
+        self._sizes = [m.sizes for m in models]
+        self._updated = [m.updated for m in models]
+        # Descriptions truncated to fit the table
+        self._descs = [
+            m.description[:60] + "..." if len(m.description) > 60 else m.description
+            for m in models
+        ]
+        # Trigram -> indices of the names containing it, to find the
+        # candidates for a filter of three or more characters
+        self._trigrams: dict[str, set[int]] = {}
+        for i, name in enumerate(self._names_lower):
+            for j in range(len(name) - 2):
+                self._trigrams.setdefault(name[j:j + 3], set()).add(i)
+        # Indices matching the last filter; "" matches every model
+        self._last_filter = ""
+        self._last_matches = list(range(len(models)))
 
     def compose(self) -> ComposeResult:
         yield Input(placeholder="Type to filter models... [/]", id="search-input")
@@ -39,7 +83,10 @@ class SearchView(Vertical):
         yield Static("", id="search-status")
 
     def on_mount(self) -> None:
-        table = self.query_one("#search-table", DataTable)
+        # Cache widget lookups; the filter path runs on every keystroke
+        self._input = self.query_one("#search-input", Input)
+        self._table = table = self.query_one("#search-table", DataTable)
+        self._status = self.query_one("#search-status", Static)
         table.add_columns("Name", "Parameters", "Updated", "Description")
         table.cursor_type = "row"
         self.load_models()
@@ -47,77 +94,137 @@ class SearchView(Vertical):
     @work(exclusive=True, group="load")
     async def load_models(self) -> None:
         """Load models from Ollama registry."""
-        table = self.query_one("#search-table", DataTable)
-        status = self.query_one("#search-status", Static)
-        table.loading = True
-        status.update("Loading models from registry...")
-
-        client = OllamaClient()
-        self._all_models = await client.search_models()
-
-        self._update_table("")
+        table = self._table
+        status = self._status
+
+        models = self._client.search_models_cached()
+        if models is None:
+            # Only show the spinner when the registry has to be downloaded
+            table.loading = True
+            status.update("Loading models from registry...")
+            models = await self._client.search_models()
+
+        self._all_models = models
+        # Keep whatever the user typed while the registry was loading
+        self._update_table(self._input.value)
         table.loading = False
 
     def _update_table(self, filter_text: str) -> None:
         """Update table with filtered models."""
-        table = self.query_one("#search-table", DataTable)
-        status = self.query_one("#search-status", Static)
+        table = self._table
+        status = self._status
 
-        table.clear()
         filter_lower = filter_text.lower()
-        count = 0
-        for model in self._all_models:
-            if filter_lower in model.name.lower():
-                # Truncate description to fit
-                desc = model.description[:60] + "..." if len(model.description) > 60 else model.description
-                table.add_row(model.name, model.sizes, model.updated, desc)
-                count += 1
-
-        # Move cursor to first row after loading
-        if table.row_count > 0:
-            table.move_cursor(row=0)
-
-        status.update(f"{count} models" + (f" (filtered)" if filter_text else ""))
+        if not filter_lower:
+            matches = list(range(len(self._models)))
+        else:
+            # Typing more characters can only narrow the previous matches
+            if self._last_filter and filter_lower.startswith(self._last_filter):
+                candidates = self._last_matches
+            elif len(filter_lower) >= 3:
+                candidates = self._trigram_candidates(filter_lower)
+            else:
+                candidates = None
+            if candidates is None:
+                matches = self._find_all(filter_lower)
+            else:
+                names_lower = self._names_lower
+                matches = [i for i in candidates if filter_lower in names_lower[i]]
+        self._last_filter = filter_lower
+        self._last_matches = matches
+
+        names, sizes, updated, descs = self._names, self._sizes, self._updated, self._descs
+        rows = [(names[i], sizes[i], updated[i], descs[i]) for i in matches]
+        self._row_names = [names[i] for i in matches]
+
+        # Rebuild the table in one batch so it is laid out once, not per row
+        with self.app.batch_update():
+            table.clear()
+            table.add_rows(rows)
+            # Move cursor to first row after loading
+            if table.row_count > 0:
+                table.move_cursor(row=0)
+
+        status.update(f"{len(rows)} models" + (f" (filtered)" if filter_text else ""))
+
+    def _find_all(self, filter_lower: str) -> list[int]:
+        """Indices of all names containing filter_lower, found in the haystack."""
+        haystack, offsets = self._haystack, self._offsets
+        matches = []
+        pos = haystack.find(filter_lower)
+        while pos != -1:
+            # The filter has no newline, so a match never spans two names
+            i = bisect_right(offsets, pos) - 1
+            matches.append(i)
+            if i + 1 == len(offsets):
+                break
+            pos = haystack.find(filter_lower, offsets[i + 1])
+        return matches
+
+    def _trigram_candidates(self, filter_lower: str) -> list[int]:
+        """Indices of the names containing every trigram of filter_lower."""
+        postings = [
+            self._trigrams.get(filter_lower[j:j + 3])
+            for j in range(len(filter_lower) - 2)
+        ]
+        if not all(postings):
+            return []
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "search-input":
-            self._update_table(event.value)
+            # Rebuild the table once typing pauses, not on every keystroke
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(self.FILTER_DELAY, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Filter the table by the current search input."""
+        self._filter_timer = None
+        self._update_table(self._input.value)
+
+    def _flush_filter(self) -> None:
+        """Apply a pending filter right away."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._apply_filter()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "search-input":
-            self.query_one("#search-table", DataTable).focus()
+            self._flush_filter()
+            self._table.focus()
 
     def action_focus_table(self) -> None:
-        self.query_one("#search-table", DataTable).focus()
+        self._flush_filter()
+        self._table.focus()
 
     def action_focus_search(self) -> None:
-        self.query_one("#search-input", Input).focus()
+        self._input.focus()
 
     def action_refresh(self) -> None:
         self.load_models()
 
     def action_pull_model(self) -> None:
-        table = self.query_one("#search-table", DataTable)
+        table = self._table
         if table.cursor_row is not None and table.row_count > 0:
-            row = table.get_row_at(table.cursor_row)
-            model_name = str(row[0])
+            model_name = self._row_names[table.cursor_row]
             self._fetch_and_show_tags(model_name)
 
     @work(exclusive=True, group="fetch_tags")
     async def _fetch_and_show_tags(self, model_name: str) -> None:
         """Fetch tags for a model and show selection screen."""
-        status = self.query_one("#search-status", Static)
+        status = self._status
         status.update(f"Loading versions for {model_name}...")
 
-        client = OllamaClient()
-        tags = await client.fetch_model_tags(model_name)
+        tags = await self._client.fetch_model_tags(model_name)
 
         if not tags:
             status.update(f"No versions found for {model_name}")
             return
 
         # Fetch local models to mark already-downloaded tags
-        local_models = await client.list_models()
+        local_models = await self._client.list_models()
         local_names = {m.name for m in local_models}
 
         status.update(f"{len(tags)} versions available")